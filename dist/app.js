@@ -13,18 +13,30 @@ import { StatusBar } from "./components/StatusBar.js";
 import { ChatView } from "./components/ChatView.js";
 import { ProgressTheme } from "./components/ProgressTheme.js";
 import { InputArea } from "./components/InputArea.js";
+import { readdir, readFile, stat } from "node:fs/promises";
+import { join, resolve } from "node:path";
 import { Session } from "./core/session.js";
 /** Load the latest session's messages from .qarin/sessions/ */
 async function loadLatestSession() {
-    const { readdir, readFile } = await import("node:fs/promises");
-    const { join, resolve } = await import("node:path");
     const sessionsDir = resolve(".qarin/sessions");
     try {
-        const files = await readdir(sessionsDir);
-        const jsonFiles = files.filter((f) => f.endsWith(".json")).sort().reverse();
-        if (jsonFiles.length === 0)
+        const entries = await readdir(sessionsDir, { withFileTypes: true });
+        // Single pass tracking the newest mtime; session IDs are random so
+        // file names carry no ordering.
+        let latest = null;
+        let latestMtime = -1;
+        for (const entry of entries) {
+            if (!entry.isFile() || !entry.name.endsWith(".json"))
+                continue;
+            const { mtimeMs } = await stat(join(sessionsDir, entry.name));
+            if (mtimeMs > latestMtime) {
+                latestMtime = mtimeMs;
+                latest = entry.name;
+            }
+        }
+        if (!latest)
             return [];
-        const content = await readFile(join(sessionsDir, jsonFiles[0]), "utf-8");
+        const content = await readFile(join(sessionsDir, latest), "utf-8");
         const data = JSON.parse(content);
         return data.contextManager?.messages ?? [];
     }
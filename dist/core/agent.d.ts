@@ -67,6 +67,8 @@ export declare class QarinAgent extends EventEmitter {
     private model;
     private sessionId;
     private startTime;
+    /** Monotonic start mark (ms) for uptime; startTime is kept for display */
+    private startMono;
     private running;
     private _messageCount;
     constructor(options: CLIOptions);
@@ -15,6 +15,44 @@ import { executeTool } from "./tools.js";
 import { IntentClassifier } from "./intent.js";
 import { TokenCounter } from "./tokens.js";
 import { HookRunner } from "./hooks.js";
+/** Tool listing for the system prompt; the built-in toolset is static per process */
+const TOOL_LIST = BUILT_IN_TOOLS
+    .map((t) => `- ${t.name}: ${t.description}`)
+    .join("\n");
+/** Maximum length of a serialized tool result fed back to the model */
+const MAX_TOOL_RESULT_LENGTH = 3000;
+/** Tools with no side effects, safe to run alongside one another */
+const READ_ONLY_TOOLS = new Set(["file_read", "grep_search", "web_fetch"]);
+/** Parse a positive integer limit, falling back when unset, non-numeric, or below 1 */
+function parseConcurrency(value, fallback) {
+    const parsed = Number.parseInt(value ?? "", 10);
+    return Number.isNaN(parsed) || parsed < 1 ? fallback : parsed;
+}
+/** Maximum tool calls in flight at once (override with QARIN_TOOL_CONCURRENCY) */
+const MAX_CONCURRENT_TOOLS = parseConcurrency(process.env.QARIN_TOOL_CONCURRENCY, 4);
+/**
+ * Map items through an async function with at most `limit` in flight,
+ * preserving order. After the first rejection no further items are started.
+ */
+async function mapWithConcurrency(items, limit, fn) {
+    const results = new Array(items.length);
+    let next = 0;
+    let failed = false;
+    const worker = async () => {
+        while (!failed && next < items.length) {
+            const index = next++;
+            try {
+                results[index] = await fn(items[index]);
+            }
+            catch (error) {
+                failed = true;
+                throw error;
+            }
+        }
+    };
+    await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+    return results;
+}
 /** Generate a UUID-like session ID */
 function generateSessionId() {
     return crypto.randomUUID();
@@ -50,12 +88,15 @@ export class QarinAgent extends EventEmitter {
     model;
     sessionId;
     startTime;
+    /** Monotonic start mark (ms) for uptime; startTime is kept for display */
+    startMono;
     running = false;
     _messageCount = 0;
     constructor(options) {
         super();
         this.sessionId = generateSessionId();
         this.startTime = new Date();
+        this.startMono = performance.now();
         // Resolve provider
         this.provider = (Object.values(Provider).find((p) => p === options.provider) ??
             Provider.OLLAMA);
@@ -78,6 +119,7 @@ export class QarinAgent extends EventEmitter {
     async start() {
         this.running = true;
         this.startTime = new Date();
+        this.startMono = performance.now();
         // Load hook configuration
         await this.hookRunner.load();
         // Fire SessionStart hook
@@ -127,9 +169,10 @@ export class QarinAgent extends EventEmitter {
             details: "Generating response...",
         });
         const chunks = [];
+        const apiMessages = this.context.getMessagesForApi();
         const streamStart = Date.now();
         try {
-            for await (const chunk of this.orchestrator.stream(this.provider, this.context.getMessagesForApi())) {
+            for await (const chunk of this.orchestrator.stream(this.provider, apiMessages)) {
                 chunks.push(chunk);
                 this.emit("stream", chunk);
             }
@@ -143,10 +186,9 @@ export class QarinAgent extends EventEmitter {
         const streamDuration = Date.now() - streamStart;
         const response = chunks.join("");
         this.context.addMessage("assistant", response);
-        // Update token counter with estimated usage
-        const estimatedPromptTokens = Math.ceil(this.context
-            .getMessagesForApi()
-            .reduce((sum, m) => sum + m.content.length, 0) / 4);
+        // Update token counter with estimated usage, reusing the payload that
+        // was actually sent rather than rebuilding the full message list
+        const estimatedPromptTokens = Math.ceil(apiMessages.reduce((sum, m) => sum + m.content.length, 0) / 4);
         const estimatedCompletionTokens = Math.ceil(response.length / 4);
         this.tokenCounter.update({
             promptTokens: estimatedPromptTokens,
@@ -233,7 +275,6 @@ export class QarinAgent extends EventEmitter {
     }
     /** Get current session status */
     getStatus() {
-        const now = new Date();
         const contextUsage = this.context.getContextUsage();
         return {
             sessionId: this.sessionId,
@@ -247,7 +288,7 @@ export class QarinAgent extends EventEmitter {
                 totalTokens: this.tokenCounter.totalTokens,
             },
             startTime: this.startTime.toISOString(),
-            duration: (now.getTime() - this.startTime.getTime()) / 1000,
+            duration: (performance.now() - this.startMono) / 1000,
         };
     }
     /** Compact the context window */
@@ -335,24 +376,59 @@ export class QarinAgent extends EventEmitter {
             this.context.addMessage("assistant", response.content || "", {
                 toolCalls: response.toolCalls,
             });
-            // Execute each tool call and append results
-            for (const tc of response.toolCalls) {
+            // Consecutive read-only calls run concurrently (bounded by
+            // MAX_CONCURRENT_TOOLS), including their hooks and permission
+            // checks; any other call runs alone once everything before it has
+            // finished, so a read never races an earlier write. Results are
+            // appended in call order so each tool message follows its tool_call_id
+            const invoke = (tc) => {
                 const toolName = tc.function.name;
-                let args;
-                try {
-                    args = JSON.parse(tc.function.arguments);
-                }
-                catch {
-                    args = {};
+                const rawArgs = tc.function.arguments;
+                let args = {};
+                // Argument-less calls arrive as "" or "{}"; skip the parse (and the
+                // throw for "") in that common case
+                if (rawArgs && rawArgs !== "{}") {
+                    try {
+                        args = JSON.parse(rawArgs);
+                    }
+                    catch {
+                        args = {};
+                    }
                 }
                 this.emit("progress", {
                     phase: OperationPhase.TESTING,
                     details: `Executing tool: ${toolName}`,
                 });
-                const result = await this.runTool(toolName, args);
-                const resultStr = JSON.stringify({ success: result.success, output: result.output, error: result.error }).slice(0, 3000);
-                this.context.addMessage("tool", resultStr, { toolCallId: tc.id });
+                return this.runTool(toolName, args);
+            };
+            const results = [];
+            let readBatch = [];
+            const flushReads = async () => {
+                if (readBatch.length > 0) {
+                    results.push(...(await mapWithConcurrency(readBatch, MAX_CONCURRENT_TOOLS, invoke)));
+                    readBatch = [];
+                }
+            };
+            for (const tc of response.toolCalls) {
+                if (READ_ONLY_TOOLS.has(tc.function.name)) {
+                    readBatch.push(tc);
+                    continue;
+                }
+                await flushReads();
+                results.push(await invoke(tc));
             }
+            await flushReads();
+            response.toolCalls.forEach((tc, i) => {
+                const result = results[i];
+                // Trim the large fields before encoding so a big file_read or
+                // shell output is not serialized in full only to be cut off
+                const resultStr = JSON.stringify({
+                    success: result.success,
+                    output: result.output.slice(0, MAX_TOOL_RESULT_LENGTH),
+                    error: result.error?.slice(0, MAX_TOOL_RESULT_LENGTH),
+                }).slice(0, MAX_TOOL_RESULT_LENGTH);
+                this.context.addMessage("tool", resultStr, { toolCallId: tc.id });
+            });
         }
         // Max rounds reached — return what we have
         const fallback = accumulatedContent.length > 0
@@ -386,9 +462,6 @@ export class QarinAgent extends EventEmitter {
     }
     /** Build the default system prompt */
     buildDefaultSystemPrompt() {
-        const toolList = BUILT_IN_TOOLS
-            .map((t) => `- ${t.name}: ${t.description}`)
-            .join("\n");
         return [
             "You are Qarin (قرين), an AI coding assistant.",
             "You help developers write, debug, test, and improve code.",
@@ -396,7 +469,7 @@ export class QarinAgent extends EventEmitter {
             "When writing code, follow the project's existing conventions.",
             "",
             "You have access to the following tools:",
-            toolList,
+            TOOL_LIST,
             "",
             "When a user asks you to perform an action (reading files, editing code,",
             "running shell commands, searching files, or fetching URLs), use the",
@@ -81,12 +81,12 @@ export class ContextManager {
     }
     /** Get messages formatted for API calls */
     getMessagesForApi() {
-        const result = [];
+        // Single concat copy; spreading into push() passes every message as a
+        // call argument, which is slower and overflows the stack on long histories
         if (this.systemMessage) {
-            result.push({ role: "system", content: this.systemMessage });
+            return [{ role: "system", content: this.systemMessage }].concat(this.messages);
         }
-        result.push(...this.messages);
-        return result;
+        return this.messages.slice();
     }
     /** Get context window usage statistics */
     getContextUsage() {
@@ -129,6 +129,10 @@ export class ContextManager {
     }
     /** Serialize context to JSON for persistence */
     toJSON() {
+        const subContexts = {};
+        for (const [contextId, subCtx] of this.subContexts) {
+            subContexts[contextId] = subCtx.toJSON();
+        }
         return {
             contextId: this.contextId,
             systemMessage: this.systemMessage,
@@ -136,7 +140,7 @@ export class ContextManager {
             totalPromptTokens: this.totalPromptTokens,
             totalCompletionTokens: this.totalCompletionTokens,
             maxContextLength: this.maxContextLength,
-            subContexts: Object.fromEntries([...this.subContexts.entries()].map(([k, v]) => [k, v.toJSON()])),
+            subContexts,
         };
     }
     /** Restore context from serialized JSON */
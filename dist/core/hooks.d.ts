@@ -22,6 +22,7 @@ import type { HookResult } from "../types/agent.js";
  */
 export declare class HookRunner {
     private hooks;
+    private enabled;
     private readonly settingsPath;
     constructor(settingsPath?: string);
     /** Load hook configuration from settings.json */
@@ -10,6 +10,8 @@ import { execFile } from "node:child_process";
 import { promisify } from "node:util";
 import { resolve } from "node:path";
 const execFileAsync = promisify(execFile);
+/** Matches `$NAME` environment variable references in hook commands */
+const ENV_VAR_PATTERN = /\$([A-Z_][A-Z0-9_]*)/g;
 /**
  * Hook runner that loads settings.json and executes hook commands.
  *
@@ -26,6 +28,7 @@ const execFileAsync = promisify(execFile);
  */
 export class HookRunner {
     hooks = {};
+    enabled = false;
     settingsPath;
     constructor(settingsPath) {
         this.settingsPath =
@@ -42,10 +45,12 @@ export class HookRunner {
         catch {
             this.hooks = {};
         }
+        // Resolved once per load; isEnabled() is checked on every tool call
+        this.enabled = Object.keys(this.hooks).length > 0;
     }
     /** Check if hooks are enabled (settings file has hooks) */
     isEnabled() {
-        return Object.keys(this.hooks).length > 0;
+        return this.enabled;
     }
     /**
      * Execute all hooks registered for an event name.
@@ -90,7 +95,7 @@ export class HookRunner {
     /** Run a single hook command via subprocess */
     async executeCommand(command, payload, timeout) {
         // Expand environment variables in command
-        const expandedCommand = command.replace(/\$([A-Z_][A-Z0-9_]*)/g, (_, name) => process.env[name] ?? "");
+        const expandedCommand = command.replace(ENV_VAR_PATTERN, (_, name) => process.env[name] ?? "");
         const payloadJson = JSON.stringify(payload);
         try {
             const { stdout, stderr } = await new Promise((resolvePromise, rejectPromise) => {
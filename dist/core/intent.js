@@ -264,11 +264,17 @@ export class IntentClassifier {
         };
     }
 }
+/** Classifiers built on demand by classifyIntent(), keyed by threshold */
+const sharedClassifiers = new Map();
 /**
  * Convenience function: classify a user prompt into an agent type.
  */
 export function classifyIntent(prompt, threshold = 0.7) {
-    const classifier = new IntentClassifier(threshold);
+    let classifier = sharedClassifiers.get(threshold);
+    if (!classifier) {
+        classifier = new IntentClassifier(threshold);
+        sharedClassifiers.set(threshold, classifier);
+    }
     return classifier.classify(prompt);
 }
 //# sourceMappingURL=intent.js.map
\ No newline at end of file
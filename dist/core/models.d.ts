@@ -22,7 +22,10 @@ export declare class AnthropicProvider implements LLMProvider {
     private readonly baseUrl;
     private readonly maxTokens;
     readonly provider = Provider.ANTHROPIC;
+    private client;
     constructor(model?: string, apiKey?: string, baseUrl?: string, maxTokens?: number);
+    /** Lazily create the SDK client once and reuse its connection pool */
+    private getClient;
     complete(messages: Message[]): AsyncGenerator<string>;
     completeSync(messages: Message[]): Promise<ModelResponse>;
 }
@@ -34,7 +37,10 @@ export declare class OpenAIProvider implements LLMProvider {
     private readonly apiKey;
     private readonly maxTokens;
     readonly provider = Provider.OPENAI;
+    private client;
     constructor(model?: string, apiKey?: string, maxTokens?: number);
+    /** Lazily create the SDK client once and reuse its connection pool */
+    private getClient;
     complete(messages: Message[]): AsyncGenerator<string>;
     completeSync(messages: Message[]): Promise<ModelResponse>;
 }
@@ -45,7 +51,10 @@ export declare class OllamaProvider implements LLMProvider {
     readonly model: string;
     private readonly host;
     readonly provider = Provider.OLLAMA;
+    private client;
     constructor(model?: string, host?: string);
+    /** Lazily create the SDK client once and reuse its connection pool */
+    private getClient;
     complete(messages: Message[]): AsyncGenerator<string>;
     completeSync(messages: Message[]): Promise<ModelResponse>;
 }
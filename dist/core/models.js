@@ -20,15 +20,23 @@ export class AnthropicProvider {
     baseUrl;
     maxTokens;
     provider = Provider.ANTHROPIC;
+    client = null;
     constructor(model = "claude-sonnet-4-20250514", apiKey = process.env.ANTHROPIC_API_KEY ?? "", baseUrl = "https://api.anthropic.com", maxTokens = 4096) {
         this.model = model;
         this.apiKey = apiKey;
         this.baseUrl = baseUrl;
         this.maxTokens = maxTokens;
     }
+    /** Lazily create the SDK client once and reuse its connection pool */
+    async getClient() {
+        if (!this.client) {
+            const { default: Anthropic } = await import("@anthropic-ai/sdk");
+            this.client = new Anthropic({ apiKey: this.apiKey });
+        }
+        return this.client;
+    }
     async *complete(messages) {
-        const { default: Anthropic } = await import("@anthropic-ai/sdk");
-        const client = new Anthropic({ apiKey: this.apiKey });
+        const client = await this.getClient();
         const apiMessages = messages
             .filter((m) => m.role !== "system")
             .map((m) => ({ role: m.role, content: m.content }));
@@ -68,14 +76,22 @@ export class OpenAIProvider {
     apiKey;
     maxTokens;
     provider = Provider.OPENAI;
+    client = null;
     constructor(model = "gpt-4", apiKey = process.env.OPENAI_API_KEY ?? "", maxTokens = 4096) {
         this.model = model;
         this.apiKey = apiKey;
         this.maxTokens = maxTokens;
     }
+    /** Lazily create the SDK client once and reuse its connection pool */
+    async getClient() {
+        if (!this.client) {
+            const { default: OpenAI } = await import("openai");
+            this.client = new OpenAI({ apiKey: this.apiKey });
+        }
+        return this.client;
+    }
     async *complete(messages) {
-        const { default: OpenAI } = await import("openai");
-        const client = new OpenAI({ apiKey: this.apiKey });
+        const client = await this.getClient();
         const stream = await client.chat.completions.create({
             model: this.model,
             messages: messages.map((m) => ({
@@ -112,13 +128,21 @@ export class OllamaProvider {
     model;
     host;
     provider = Provider.OLLAMA;
+    client = null;
     constructor(model = "qwen2.5", host = process.env.OLLAMA_HOST ?? "http://localhost:11434") {
         this.model = model;
         this.host = host;
     }
+    /** Lazily create the SDK client once and reuse its connection pool */
+    async getClient() {
+        if (!this.client) {
+            const { Ollama } = await import("ollama");
+            this.client = new Ollama({ host: this.host });
+        }
+        return this.client;
+    }
     async *complete(messages) {
-        const { Ollama } = await import("ollama");
-        const client = new Ollama({ host: this.host });
+        const client = await this.getClient();
         const response = await client.chat({
             model: this.model,
             messages: messages.map((m) => ({
@@ -134,8 +158,7 @@ export class OllamaProvider {
         }
     }
     async completeSync(messages) {
-        const { Ollama } = await import("ollama");
-        const client = new Ollama({ host: this.host });
+        const client = await this.getClient();
         const response = await client.chat({
             model: this.model,
             messages: messages.map((m) => ({
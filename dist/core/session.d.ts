@@ -22,6 +22,8 @@ export declare class Session {
     readonly tokenCounter: TokenCounter;
     readonly hooksEnabled: boolean;
     private startTime;
+    /** Monotonic start mark (ms) for uptime; only set by start() in this process */
+    private startMono;
     private endTime;
     private _messageCount;
     constructor(options?: {
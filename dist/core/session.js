@@ -5,13 +5,56 @@
  * Manages session state with save/load for continuity across runs,
  * QARIN.md project context seeding, and session summary tracking.
  */
-import { readFile, writeFile, mkdir, access } from "node:fs/promises";
+import { readFile, writeFile, appendFile, mkdir, access, rename, unlink, stat } from "node:fs/promises";
 import { resolve, join, dirname } from "node:path";
 import { randomUUID } from "node:crypto";
 import { ContextManager } from "./context.js";
 import { TokenCounter } from "./tokens.js";
 const SESSIONS_DIR = ".qarin/sessions";
 const QARIN_MD = "QARIN.md";
+/** Base system prompt shared by every session */
+const BASE_SYSTEM_PROMPT = [
+    "You are Qarin, an AI coding assistant.",
+    "You help developers write, debug, test, and improve code.",
+    "You have access to file operations, shell commands, and web search.",
+    "Be concise, accurate, and helpful.",
+    "When writing code, follow the project's existing conventions.",
+].join("\n");
+/**
+ * QARIN.md contents by path, reused across sessions until the file's mtime or
+ * size changes. Left unbounded: keys are only QARIN.md files found by walking
+ * up from the working directory, so a process holds one or a few.
+ */
+const qarinMdCache = new Map();
+/** Read QARIN.md, serving repeat reads of an unchanged file from memory */
+async function readQarinMd(path) {
+    // Nanosecond mtime plus size, so an edit within one coarse timestamp tick
+    // still invalidates the entry in the common case
+    const { mtimeNs, size } = await stat(path, { bigint: true });
+    const cached = qarinMdCache.get(path);
+    if (cached && cached.mtimeNs === mtimeNs && cached.size === size) {
+        return cached.content;
+    }
+    const content = await readFile(path, "utf-8");
+    qarinMdCache.set(path, { mtimeNs, size, content });
+    return content;
+}
+/**
+ * Write a file atomically: write a sibling temp file, then rename it over
+ * the target so readers never observe a truncated or partial file.
+ */
+async function writeFileAtomic(path, data) {
+    // Unique per call so overlapping saves of one session never share a temp file
+    const tmpPath = `${path}.${process.pid}.${randomUUID()}.tmp`;
+    try {
+        await writeFile(tmpPath, data, "utf-8");
+        await rename(tmpPath, path);
+    }
+    catch (error) {
+        await unlink(tmpPath).catch(() => { });
+        throw error;
+    }
+}
 /**
  * Session manager with persistence and QARIN.md integration.
  *
@@ -26,6 +69,8 @@ export class Session {
     tokenCounter;
     hooksEnabled;
     startTime = null;
+    /** Monotonic start mark (ms) for uptime; only set by start() in this process */
+    startMono = null;
     endTime = null;
     _messageCount = 0;
     constructor(options = {}) {
@@ -43,19 +88,14 @@ export class Session {
     /** Start the session, loading QARIN.md context if available */
     async start() {
         this.startTime = new Date();
+        this.startMono = performance.now();
         // Build system prompt
-        let systemPrompt = [
-            "You are Qarin, an AI coding assistant.",
-            "You help developers write, debug, test, and improve code.",
-            "You have access to file operations, shell commands, and web search.",
-            "Be concise, accurate, and helpful.",
-            "When writing code, follow the project's existing conventions.",
-        ].join("\n");
+        let systemPrompt = BASE_SYSTEM_PROMPT;
         // Load QARIN.md project context if available
         const qarinMd = await this.findQarinMd();
         if (qarinMd) {
             try {
-                const content = await readFile(qarinMd, "utf-8");
+                const content = await readQarinMd(qarinMd);
                 systemPrompt +=
                     "\n\nThe following project context was loaded from QARIN.md:\n\n" +
                         content;
@@ -75,19 +115,26 @@ export class Session {
     async end() {
         this.endTime = new Date();
         const summary = this.buildSummary();
-        // Append summary to QARIN.md if it exists
-        const qarinMd = await this.findQarinMd();
-        if (qarinMd) {
-            await this.appendToQarinMd(qarinMd, summary);
+        // Append summary to QARIN.md if it exists; sessions that recorded no
+        // messages leave nothing worth logging, so skip the lookup and write
+        if (this._messageCount > 0) {
+            const qarinMd = await this.findQarinMd();
+            if (qarinMd) {
+                await this.appendToQarinMd(qarinMd, summary);
+            }
         }
         return summary;
     }
     /** Get current session status */
     getStatus() {
-        const now = new Date();
-        const duration = this.startTime
-            ? (now.getTime() - this.startTime.getTime()) / 1000
-            : 0;
+        let duration = 0;
+        if (this.startMono !== null) {
+            duration = (performance.now() - this.startMono) / 1000;
+        }
+        else if (this.startTime) {
+            // Loaded sessions started in another process; fall back to wall clock
+            duration = (Date.now() - this.startTime.getTime()) / 1000;
+        }
         const contextUsage = this.context.getContextUsage();
         return {
             sessionId: this.sessionId,
@@ -128,7 +175,7 @@ export class Session {
         const resolvedPath = resolve(savePath);
         const dir = dirname(resolvedPath);
         await mkdir(dir, { recursive: true });
-        await writeFile(resolvedPath, JSON.stringify(data, null, 2), "utf-8");
+        await writeFileAtomic(resolvedPath, JSON.stringify(data));
         return resolvedPath;
     }
     /** Load a session from a JSON file */
@@ -204,22 +251,19 @@ export class Session {
         // This mirrors the Python implementation behavior but without a hard depth limit.
         for (;;) {
             const candidate = join(current, QARIN_MD);
-            try {
-                await access(candidate);
+            // Probe for QARIN.md and the .git marker concurrently; both are
+            // independent filesystem round-trips at each level.
+            const [hasQarinMd, hasGitDir] = await Promise.all([
+                access(candidate).then(() => true, () => false),
+                access(join(current, ".git")).then(() => true, () => false),
+            ]);
+            if (hasQarinMd) {
                 return candidate;
             }
-            catch {
-                // Not found at this level, keep walking up.
-            }
             // Stop if we detect a .git directory, assuming we've reached the repo root.
-            const gitDir = join(current, ".git");
-            try {
-                await access(gitDir);
+            if (hasGitDir) {
                 break;
             }
-            catch {
-                // No .git here, continue walking up unless we're at the filesystem root.
-            }
             const parent = resolve(current, "..");
             if (parent === current) {
                 break;
@@ -239,8 +283,7 @@ export class Session {
             `(prompt: ${summary.promptTokens.toLocaleString()}, ` +
             `completion: ${summary.completionTokens.toLocaleString()})\n`;
         try {
-            const existing = await readFile(qarinMdPath, "utf-8");
-            await writeFile(qarinMdPath, existing + entry, "utf-8");
+            await appendFile(qarinMdPath, entry, "utf-8");
         }
         catch (error) {
             // Log but do not throw, to avoid crashing on non-critical QARIN.md failures
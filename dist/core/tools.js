@@ -4,7 +4,7 @@
  * Ports the Python skills/tools.py into TypeScript.
  * Provides file operations, shell execution, and search capabilities.
  */
-import { readFile, writeFile, access } from "node:fs/promises";
+import { readFile, writeFile, access, mkdir } from "node:fs/promises";
 import { execFile } from "node:child_process";
 import { promisify } from "node:util";
 import { resolve, dirname } from "node:path";
@@ -44,7 +44,6 @@ export async function fileRead(path) {
 export async function fileWrite(path, content) {
     try {
         const resolvedPath = resolve(path);
-        const { mkdir } = await import("node:fs/promises");
         await mkdir(dirname(resolvedPath), { recursive: true });
         await writeFile(resolvedPath, content, "utf-8");
         return { success: true, output: `Written ${content.length} bytes to ${path}` };
@@ -72,10 +71,9 @@ export async function fileEdit(path, startLine, endLine, newContent) {
                 error: `Invalid line range: ${startLine}-${endLine} (file has ${lines.length} lines)`,
             };
         }
-        const before = lines.slice(0, startLine - 1);
-        const after = lines.slice(endLine);
-        const newLines = [...before, newContent, ...after];
-        await writeFile(resolvedPath, newLines.join("\n"), "utf-8");
+        // Replace the range in place rather than copying both halves of the file
+        lines.splice(startLine - 1, endLine - startLine + 1, newContent);
+        await writeFile(resolvedPath, lines.join("\n"), "utf-8");
         return {
             success: true,
             output: `Edited lines ${startLine}-${endLine} in ${path}`,
@@ -7,8 +7,14 @@
 import { useState, useCallback, useEffect, useRef } from "react";
 import { OperationPhase } from "../types/theme.js";
 import { QarinAgent } from "../core/agent.js";
+/** Minimum interval between streamed-output renders (~one frame) */
+const STREAM_FLUSH_INTERVAL_MS = 16;
 export function useAgent(options) {
     const agentRef = useRef(null);
+    // Streamed chunks are buffered here and flushed to state at most once per
+    // frame, instead of re-rendering the whole tree for every token.
+    const pendingStreamRef = useRef([]);
+    const flushTimerRef = useRef(null);
     const [phase, setPhase] = useState(OperationPhase.ANALYZING);
     const [details, setDetails] = useState("");
     const [isProcessing, setIsProcessing] = useState(false);
@@ -17,6 +23,18 @@ export function useAgent(options) {
     const [intent, setIntent] = useState(null);
     const [tokenDisplay, setTokenDisplay] = useState("");
     const [error, setError] = useState(null);
+    const flushStream = useCallback(() => {
+        if (flushTimerRef.current !== null) {
+            clearTimeout(flushTimerRef.current);
+            flushTimerRef.current = null;
+        }
+        const pending = pendingStreamRef.current;
+        if (pending.length === 0)
+            return;
+        pendingStreamRef.current = [];
+        const text = pending.join("");
+        setStreamOutput((prev) => prev + text);
+    }, []);
     useEffect(() => {
         const agent = new QarinAgent(options);
         agentRef.current = agent;
@@ -26,22 +44,32 @@ export function useAgent(options) {
                 setDetails(d);
         });
         agent.on("stream", (chunk) => {
-            setStreamOutput((prev) => prev + chunk);
+            pendingStreamRef.current.push(chunk);
+            if (flushTimerRef.current === null) {
+                flushTimerRef.current = setTimeout(flushStream, STREAM_FLUSH_INTERVAL_MS);
+            }
         });
         agent.on("intent", (intentResult) => {
             setIntent(intentResult);
         });
         agent.on("error", ({ error: err }) => {
+            flushStream();
             setError(err);
             setIsProcessing(false);
         });
         agent.on("success", () => {
+            // Flush any buffered tail so the final response is complete
+            flushStream();
             setIsProcessing(false);
             setStatus(agent.getStatus());
             setTokenDisplay(agent.getTokenCounter().formatDisplay());
         });
         agent.start().catch((err) => setError(err));
         return () => {
+            if (flushTimerRef.current !== null) {
+                clearTimeout(flushTimerRef.current);
+                flushTimerRef.current = null;
+            }
             // Intentionally suppress cleanup errors — agent resources are best-effort released
             agent.end().catch(() => { });
         };
@@ -52,6 +80,7 @@ export function useAgent(options) {
         if (!agent)
             return;
         setIsProcessing(true);
+        pendingStreamRef.current = [];
         setStreamOutput("");
         setError(null);
         try {
@@ -63,9 +92,10 @@ export function useAgent(options) {
             setError(err instanceof Error ? err : new Error(String(err)));
         }
         finally {
+            flushStream();
             setIsProcessing(false);
         }
-    }, []);
+    }, [flushStream]);
     const runTool = useCallback(async (name, args) => {
         const agent = agentRef.current;
         if (!agent)
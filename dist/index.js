@@ -1,8 +1,5 @@
 #!/usr/bin/env node
-import { jsx as _jsx } from "react/jsx-runtime";
-import { render } from "ink";
 import { Command } from "commander";
-import QarinApp from "./app.js";
 import { getAvailableThemes } from "./themes/index.js";
 const program = new Command();
 program
@@ -17,7 +14,7 @@ program
     .option("--resume", "Resume the latest session")
     .option("--system-prompt <prompt>", "Custom system prompt")
     .option("--output-format <format>", "Output format: text, json, markdown", "text")
-    .action((task, opts) => {
+    .action(async (task, opts) => {
     const options = {
         model: opts.model,
         provider: opts.provider,
@@ -27,7 +24,42 @@ program
         systemPrompt: opts.systemPrompt,
         outputFormat: opts.outputFormat,
     };
+    if (options.print && !task) {
+        program.error("error: --print requires a task argument");
+    }
+    if (options.print && options.resume) {
+        program.error("error: --resume cannot be combined with --print");
+    }
+    if (options.print) {
+        // Non-interactive mode: stream straight to stdout without loading
+        // React/Ink at all.
+        const { QarinAgent } = await import("./core/agent.js");
+        const agent = new QarinAgent(options);
+        agent.on("error", ({ error }) => {
+            process.stderr.write(`Error: ${error.message}\n`);
+            process.exitCode = 1;
+        });
+        if (options.outputFormat === "json") {
+            const response = await agent.executeTask(task);
+            const status = await agent.end();
+            process.stdout.write(JSON.stringify({ response, status }) + "\n");
+        }
+        else {
+            agent.on("stream", (chunk) => process.stdout.write(chunk));
+            await agent.executeTask(task);
+            await agent.end();
+            process.stdout.write("\n");
+        }
+        return;
+    }
+    // Load React/Ink and the app only when actually rendering, so --help and
+    // --version do not pay for the UI stack at startup.
+    const [{ jsx: _jsx }, { render }, { default: QarinApp }] = await Promise.all([
+        import("react/jsx-runtime"),
+        import("ink"),
+        import("./app.js"),
+    ]);
     render(_jsx(QarinApp, { task: task, options: options }));
 });
-program.parse();
+await program.parseAsync();
 //# sourceMappingURL=index.js.map
\ No newline at end of file